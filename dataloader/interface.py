@@ -174,19 +174,18 @@ class LitData(pl.LightningDataModule):
             self.use_pixel_centers
         )
 
-        _rays = np.stack([rays_o, rays_d], axis=1)
         device_count = self.num_gpus if not self.use_tpu else self.num_tpus
-        n_dset = len(_rays)
+        n_dset = len(rays_o)
 
         dummy_num = (
             device_count - n_dset % device_count
         ) % device_count if dummy else 0
 
-        rays = np.zeros((n_dset + dummy_num, 2, 3), dtype=np.float32)
-        rays[:n_dset] = _rays
-
-        if dummy:
-            rays[n_dset:] = rays[:dummy_num]
+        # Origins and directions are kept in separate (N, 3) arrays so
+        # that batches reach the renderer as contiguous tensors.
+        if dummy_num > 0:
+            rays_o = np.concatenate([rays_o, rays_o[:dummy_num]])
+            rays_d = np.concatenate([rays_d, rays_d[:dummy_num]])
 
         if image_exist:
             images_idx = np.concatenate([_images[i].reshape(-1, 3) for i in idx])
@@ -194,7 +193,7 @@ class LitData(pl.LightningDataModule):
             images[:n_dset] = images_idx
             images[n_dset:] = images[:dummy_num]
 
-        return RaySet(images, rays), dummy_num
+        return RaySet(images, rays_o, rays_d), dummy_num
 
     
     def train_dataloader(self):
@@ -147,17 +147,21 @@ class MultipleImageWOReplaceDDPSampler(MultipleImageDDPSampler):
 
 class RaySet(Dataset):
 
-    def __init__(self, images=None, rays=None):
+    def __init__(self, images=None, rays_o=None, rays_d=None):
         self.images = images
         self.images_exist = self.images is not None
-        assert rays is not None
-        rays[:, 1] = rays[:, 1] / np.linalg.norm(rays[:, 1], axis=1)[:, np.newaxis]
-        self.rays = rays
+        assert rays_o is not None and rays_d is not None
+        rays_d = rays_d / np.linalg.norm(rays_d, axis=1)[:, np.newaxis]
+        self.rays_o = rays_o
+        self.rays_d = rays_d
         
-        self.N = len(rays)
+        self.N = len(rays_o)
 
     def __getitem__(self, index):
-        ret = {"ray": torch.from_numpy(self.rays[index])}
+        ret = {
+            "rays_o": torch.from_numpy(self.rays_o[index]),
+            "rays_d": torch.from_numpy(self.rays_d[index]),
+        }
         if self.images_exist: 
             ret["target"] = torch.from_numpy(self.images[index])
         return ret
@@ -1,6 +1,5 @@
 import pytorch_lightning as pl
 
-import numpy as np
 import torch
 import json
 
@@ -27,14 +26,13 @@ class LitModel(pl.LightningModule):
 
     @torch.no_grad()
     def psnr_each(self, preds, gts):
-        psnr_list = []
-        for (pred, gt) in zip(preds, gts): 
-            pred = torch.clip(pred, 0, 1)
-            gt = torch.clip(gt, 0, 1)
-            mse = torch.mean((pred - gt) ** 2)
-            psnr = -10.0 * torch.log(mse) / np.log(10)
-            psnr_list.append(psnr)
-        return torch.stack(psnr_list)
+        # Only the per-image MSE reduction is done per image; the PSNR
+        # conversion runs once over the stacked MSEs on device.
+        mse = torch.stack([
+            torch.mean((torch.clip(pred, 0, 1) - torch.clip(gt, 0, 1)) ** 2)
+            for (pred, gt) in zip(preds, gts)
+        ])
+        return -10.0 * torch.log10(mse)
 
     @torch.no_grad()
     def ssim_each(self, preds, gts):
@@ -1,4 +1,5 @@
 import json
+import math
 import os
 from typing import *
 
@@ -381,19 +382,25 @@ class LitPlenoxel(LitModel):
     def get_expon_lr_func(
         self, lr_init, lr_final, lr_delay_steps, lr_delay_mult, max_steps
     ):
+        # Evaluated several times per step; keep it on Python floats
+        # rather than dispatching NumPy ufuncs on scalars.
+        # A zero rate maps to -inf (as np.log did) without taking log(0).
+        log_lr_init = math.log(lr_init) if lr_init > 0.0 else -math.inf
+        log_lr_final = math.log(lr_final) if lr_final > 0.0 else -math.inf
+
         def helper(step):
             if step < 0 or (lr_init == 0.0 and lr_final == 0.0):
                 # Disable this parameter
                 return 0.0
             if lr_delay_steps > 0:
                 # A kind of reverse cosine decay.
-                delay_rate = lr_delay_mult + (1 - lr_delay_mult) * np.sin(
-                    0.5 * np.pi * np.clip(step / lr_delay_steps, 0, 1)
+                delay_rate = lr_delay_mult + (1 - lr_delay_mult) * math.sin(
+                    0.5 * math.pi * min(max(step / lr_delay_steps, 0.0), 1.0)
                 )
             else:
                 delay_rate = 1.0
-            t = np.clip(step / max_steps, 0, 1)
-            log_lerp = np.exp(np.log(lr_init) * (1 - t) + np.log(lr_final) * t)
+            t = min(max(step / max_steps, 0.0), 1.0)
+            log_lerp = math.exp(log_lr_init * (1 - t) + log_lr_final * t)
             return delay_rate * log_lerp
 
         return helper
@@ -442,18 +449,16 @@ class LitPlenoxel(LitModel):
         if self.quant_bit == 8 or self.quant_bit == 16: 
             data_tensor = data.type(torch.FloatTensor) * data_scale + data_min
         elif self.quant_bit == 4:
-            data_blank = torch.zeros(len(data) * 2, *data.shape[1:], device=data.device)
-            data_blank[0::2] = data // 16
-            data_blank[1::2] = data % 16
-            if torch.all(data_blank[-1] == 0): 
+            # Unpack the nibbles with bit ops on the uint8 storage and
+            # interleave them, instead of filling a float buffer twice.
+            data_blank = torch.stack([data >> 4, data & 0xF], dim=1).flatten(0, 1)
+            if torch.all(data_blank[-1] == 0):
                 data_blank = data_blank[:-1]
             data_tensor = data_blank.type(torch.FloatTensor) * data_scale + data_min
         elif self.quant_bit == 2:
-            data_blank = torch.zeros(len(data) * 4, *data.shape[1:], device=data.device)
-            data_blank[0::4] = data // 64
-            data_blank[1::4] = data % 64 // 16
-            data_blank[2::4] = data % 16 // 4
-            data_blank[3::4] = data % 4
+            data_blank = torch.stack(
+                [data >> 6, (data >> 4) & 0x3, (data >> 2) & 0x3, data & 0x3], dim=1
+            ).flatten(0, 1)
             for _ in range(4):
                 if torch.all(data_blank[-1]) == 0:
                     data_blank = data_blank[:-1]
@@ -498,14 +503,14 @@ class LitPlenoxel(LitModel):
         lr_color_bg = self.lr_color_bg_func(gstep - self.lr_basis_begin_step)
 
         # Plenoxel only supports Float32
-        rays, target = batch["ray"].to(torch.float32), batch["target"].to(torch.float32)
+        origins = batch["rays_o"].to(torch.float32)
+        dirs = batch["rays_d"].to(torch.float32)
+        target = batch["target"].to(torch.float32)
 
         if self.ndc_coeffs[0] != -1 or self.ndc_coeffs[1] != -1:
-            rays = torch.stack(
-                ray.convert_to_ndc(rays[:, 0], rays[:, 1], self.ndc_coeffs), dim=1
-            )
+            origins, dirs = ray.convert_to_ndc(origins, dirs, self.ndc_coeffs)
 
-        rays = dataclass.Rays(rays[:, 0].contiguous(), rays[:, 1].contiguous())
+        rays = dataclass.Rays(origins.contiguous(), dirs.contiguous())
 
         rgb, _ = self.model.volume_render_fused(
             rays,
@@ -596,23 +601,22 @@ class LitPlenoxel(LitModel):
         out_mask=False,
     ):
         ret = {}
-        rays = batch["ray"].to(torch.float32)
+        origins = batch["rays_o"].to(torch.float32)
+        dirs = batch["rays_d"].to(torch.float32)
         if "target" in batch.keys():
             target = batch["target"].to(torch.float32)
         else:
             target = (
                 torch.zeros(
-                    (len(batch["ray"]), 3), dtype=torch.float32, device=self.device
+                    (len(origins), 3), dtype=torch.float32, device=self.device
                 )
                 + 0.5
             )
 
         if self.ndc_coeffs[0] != -1 or self.ndc_coeffs[1] != -1:
-            rays = torch.stack(
-                ray.convert_to_ndc(rays[:, 0], rays[:, 1], self.ndc_coeffs), dim=1
-            )
+            origins, dirs = ray.convert_to_ndc(origins, dirs, self.ndc_coeffs)
 
-        rays = dataclass.Rays(rays[:, 0].contiguous(), rays[:, 1].contiguous())
+        rays = dataclass.Rays(origins.contiguous(), dirs.contiguous())
         rgb, mask = self.model.volume_render_fused(
             rays,
             target,
@@ -701,8 +705,11 @@ class LitPlenoxel(LitModel):
         if self.trainer.is_global_zero:
             image_dir = os.path.join(self.logdir, "render_model")
             os.makedirs(image_dir, exist_ok=True)
-            store_util.store_image(image_dir, rgbs)
-            store_util.store_video(self.logdir, rgbs)
+            # Metrics above run on device; copy the renders to host once
+            # and share them between the image and video writers.
+            rgbs_cpu = [rgb.cpu() for rgb in rgbs]
+            store_util.store_image(image_dir, rgbs_cpu)
+            store_util.store_video(self.logdir, rgbs_cpu)
 
             self.write_stats(
                 os.path.join(self.logdir, "results.json"), psnr, ssim, lpips
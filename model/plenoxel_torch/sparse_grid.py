@@ -172,6 +172,7 @@ class SparseGrid(nn.Module):
         self.sh_rms: Optional[torch.Tensor] = None
         self.background_rms: Optional[torch.Tensor] = None
         self.basis_rms: Optional[torch.Tensor] = None
+        self._grid_transform_cache: Optional[Tuple] = None
 
         if self.links.is_cuda and use_sphere_bound:
             self.accelerate()
@@ -254,23 +255,42 @@ class SparseGrid(nn.Module):
             wa = 1.0 - wb
 
             lx, ly, lz = l.unbind(-1)
-            links000 = self.links[lx, ly, lz]
-            links001 = self.links[lx, ly, lz + 1]
-            links010 = self.links[lx, ly + 1, lz]
-            links011 = self.links[lx, ly + 1, lz + 1]
-            links100 = self.links[lx + 1, ly, lz]
-            links101 = self.links[lx + 1, ly, lz + 1]
-            links110 = self.links[lx + 1, ly + 1, lz]
-            links111 = self.links[lx + 1, ly + 1, lz + 1]
-
-            sigma000, rgb000 = self._fetch_links(links000)
-            sigma001, rgb001 = self._fetch_links(links001)
-            sigma010, rgb010 = self._fetch_links(links010)
-            sigma011, rgb011 = self._fetch_links(links011)
-            sigma100, rgb100 = self._fetch_links(links100)
-            sigma101, rgb101 = self._fetch_links(links101)
-            sigma110, rgb110 = self._fetch_links(links110)
-            sigma111, rgb111 = self._fetch_links(links111)
+            links = torch.stack(
+                [
+                    self.links[lx, ly, lz],
+                    self.links[lx, ly, lz + 1],
+                    self.links[lx, ly + 1, lz],
+                    self.links[lx, ly + 1, lz + 1],
+                    self.links[lx + 1, ly, lz],
+                    self.links[lx + 1, ly, lz + 1],
+                    self.links[lx + 1, ly + 1, lz],
+                    self.links[lx + 1, ly + 1, lz + 1],
+                ]
+            )
+
+            # Fetch all 8 corners with a single gather instead of 8
+            n = lx.shape[0]
+            sigmas, rgbs = self._fetch_links(links.view(-1))
+            (
+                sigma000,
+                sigma001,
+                sigma010,
+                sigma011,
+                sigma100,
+                sigma101,
+                sigma110,
+                sigma111,
+            ) = sigmas.view(8, n, 1).unbind(0)
+            (
+                rgb000,
+                rgb001,
+                rgb010,
+                rgb011,
+                rgb100,
+                rgb101,
+                rgb110,
+                rgb111,
+            ) = rgbs.view(8, n, rgbs.size(-1)).unbind(0)
 
             c00 = sigma000 * wa[:, 2:] + sigma001 * wb[:, 2:]
             c01 = sigma010 * wa[:, 2:] + sigma011 * wb[:, 2:]
@@ -1250,9 +1270,7 @@ class SparseGrid(nn.Module):
             gspec._offset = torch.zeros_like(self._offset)
             gspec._scaling = torch.ones_like(self._offset)
         else:
-            gsz = self._grid_size()
-            gspec._offset = self._offset * gsz - 0.5
-            gspec._scaling = self._scaling * gsz
+            gspec._offset, gspec._scaling = self._grid_transform()
 
         gspec.basis_dim = self.basis_dim
         gspec.basis_type = self.basis_type
@@ -1269,6 +1287,24 @@ class SparseGrid(nn.Module):
     def _grid_size(self):
         return torch.tensor(self.links.shape, device="cpu", dtype=torch.float32)
 
+    def _grid_transform(self):
+        """
+        World-to-grid offset and scaling passed to C++ on every render call.
+        Cached per grid shape, since the shape only changes on resample/load.
+        """
+        shape = tuple(self.links.shape)
+        if (
+            self._grid_transform_cache is None
+            or self._grid_transform_cache[0] != shape
+        ):
+            gsz = self._grid_size()
+            self._grid_transform_cache = (
+                shape,
+                self._offset * gsz - 0.5,
+                self._scaling * gsz,
+            )
+        return self._grid_transform_cache[1:]
+
     def _get_data_grads(self):
         ret = []
         for subitem in ["density_data", "sh_data", "basis_data", "background_data"]:
@@ -12,7 +12,7 @@ def img2mse(x, y):
 
 
 def mse2psnr(x):
-    return -10.0 * torch.log(x) / np.log(10)
+    return -10.0 * torch.log10(x)
 
 
 def inthroot(x: int, n: int):
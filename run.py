@@ -57,6 +57,7 @@ def run(
     num_tpus: Optional[int] = None,
     num_sanity_val_steps: int = 0,
     seed: int = 777,
+    deterministic: bool = False,
     debug: bool = False,
     save_last_only: bool = False,
     check_val_every_n_epoch: int = 1,
@@ -122,6 +123,7 @@ def run(
         precision=precision,
         accelerator="gpu",
         num_sanity_val_steps=num_sanity_val_steps,
+        deterministic=deterministic,
         callbacks=callbacks,
     )
 